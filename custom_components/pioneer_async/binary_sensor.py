@@ -150,13 +150,15 @@ class PioneerGenericBinarySensor(PioneerBinarySensor):
     @property
     def is_on(self) -> bool:
         """Retrieve boolean state."""
+        zone = self.zone
+        promoted_property = self.promoted_property
         base_property_value = getattr(self.pioneer, self.base_property, {})
-        if self.zone is not None:
-            base_property_value = base_property_value.get(self.zone, {})
-        if self.promoted_property is None:
+        if zone is not None:
+            base_property_value = base_property_value.get(zone, {})
+        if promoted_property is None:
             value = base_property_value
         else:
-            value = base_property_value.get(self.promoted_property)
+            value = base_property_value.get(promoted_property)
         if value is None:
             return None
         return True if value else False
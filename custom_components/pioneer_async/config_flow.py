@@ -51,6 +51,7 @@ from .const import (
     CONF_SOURCES,
     CONF_PARAMS,
     CONF_REPEAT_COUNT,
+    CONF_RETRY_DELAY,
     CONF_IGNORE_ZONE_2,
     CONF_IGNORE_ZONE_3,
     CONF_IGNORE_HDZONE,
@@ -61,6 +62,7 @@ from .const import (
     DEFAULT_PORT,
     OPTIONS_DEFAULTS,
     OPTIONS_ALL,
+    MAX_RETRY_DELAY,
     DEFAULTS_EXCLUDE,
     ATTR_PIONEER,
 )
@@ -124,6 +126,17 @@ def _get_schema_basic_options(defaults: list) -> dict:
                 mode=selector.NumberSelectorMode.SLIDER,
             )
         ),
+        vol.Optional(
+            CONF_RETRY_DELAY, default=defaults[CONF_RETRY_DELAY]
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0.0,
+                max=MAX_RETRY_DELAY,
+                step=0.1,
+                unit_of_measurement="s",
+                mode=selector.NumberSelectorMode.SLIDER,
+            )
+        ),
     }
 
 
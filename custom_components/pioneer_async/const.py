@@ -36,10 +36,13 @@ DEFAULT_PORT = 8102  # Some Pioneer AVRs use 23
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=60)
 DEFAULT_TIMEOUT = 5
 DEFAULT_SOURCES = {}
+DEFAULT_RETRY_DELAY = 0.1
+MAX_RETRY_DELAY = 1.0
 
 CONF_SOURCES = "sources"
 CONF_PARAMS = "params"
 CONF_REPEAT_COUNT = "repeat_count"
+CONF_RETRY_DELAY = "retry_delay"
 CONF_IGNORE_ZONE_2 = "ignore_zone_2"  ## UI option only
 CONF_IGNORE_ZONE_3 = "ignore_zone_3"  ## UI option only
 CONF_IGNORE_HDZONE = "ignore_hdzone"  ## UI option only
@@ -70,6 +73,7 @@ OPTIONS_DEFAULTS = {
     CONF_SOURCES: {},
     CONF_PARAMS: {},
     CONF_REPEAT_COUNT: 4,
+    CONF_RETRY_DELAY: DEFAULT_RETRY_DELAY,
     CONF_IGNORE_ZONE_2: False,
     CONF_IGNORE_ZONE_3: False,
     CONF_IGNORE_HDZONE: False,
@@ -11,16 +11,21 @@ class Debug:
 
     level = 0  # deprecated
     config = {}
+    atlevel_cache: dict[tuple[int, str], bool] = {}
 
     def setconfig(self, config: dict[str, int] | None) -> None:
         """Set debug model config."""
         _LOGGER.debug(">> Debug.setconfig(%s)", config)
         Debug.config = config
+        Debug.atlevel_cache = {}
 
     def atlevel(self, level: int, category_raw: str) -> bool:
         """Determine if debug is at a level"""
         if not Debug.config:
             return False
+        cache_key = (level, category_raw)
+        if (cached := Debug.atlevel_cache.get(cache_key)) is not None:
+            return cached
         category = category_raw.partition(DOMAIN + ".")[2] or DOMAIN
         try:
             debug_level_str = Debug.config.get(category, Debug.config.get("*", 0))
@@ -30,4 +35,5 @@ class Debug:
                 "invalid debug level for category %s: %s", category, debug_level_str
             )
             return None
-        return debug_level >= level
+        Debug.atlevel_cache[cache_key] = result = debug_level >= level
+        return result
@@ -14,7 +14,7 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
 from homeassistant.util import slugify
 
-from .const import DOMAIN, CONF_REPEAT_COUNT
+from .const import DOMAIN, CONF_REPEAT_COUNT, CONF_RETRY_DELAY, MAX_RETRY_DELAY
 from .debug import Debug
 
 _LOGGER = logging.getLogger(__name__)
@@ -48,56 +48,79 @@ class PioneerEntityBase(Entity):
     @property
     def unique_id(self) -> str:
         """Return the unique id."""
-        entry_id = self.platform.config_entry.entry_id
-        name_suffix = "-" + slugify(self._attr_name) if self._attr_name else ""
-        zone_suffix = "-" + str(self.zone) if self.zone is not None else ""
-        return f"{entry_id}{zone_suffix}{name_suffix}"
+        ## Entity registry looks up unique_id before async_added_to_hass is called,
+        ## so generate it on first access once the platform has been set
+        if self._attr_unique_id is None:
+            entry_id = self.platform.config_entry.entry_id
+            name_suffix = "-" + slugify(self._attr_name) if self._attr_name else ""
+            zone_suffix = "-" + str(self.zone) if self.zone is not None else ""
+            self._attr_unique_id = "".join((entry_id, zone_suffix, name_suffix))
+        return self._attr_unique_id
 
     @property
     def available(self) -> bool:
         """Returns whether the AVR is available and the zone is on."""
-        return self.pioneer.available and (
-            self.zone is None
-            or (self.zone in self.pioneer.zones and self.pioneer.power.get(self.zone))
+        pioneer = self.pioneer
+        zone = self.zone
+        return pioneer.available and (
+            zone is None or (zone in pioneer.zones and pioneer.power.get(zone))
         )
 
-    async def pioneer_command(self, aw_f, command: str = None, repeat: bool = False):
+    def _command_exception(
+        self, exc: Exception, command_name: str
+    ) -> ServiceValidationError:
+        """Translate an exception raised by a PioneerAVR command."""
+        if isinstance(exc, AVRCommandError):
+            return ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="command_error",
+                translation_placeholders={
+                    "command": command_name,
+                    "exc": str(exc),
+                },
+            )
+        return ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key=getattr(exc, "translation_key", "unknown_exception"),
+            translation_placeholders={
+                "command": command_name,
+                "zone": self.zone,
+                "exc": str(exc),
+            },
+        )
+
+    async def pioneer_command(
+        self, aw_f, *args, command: str = None, repeat: bool = False, **kwargs
+    ):
         """Execute a PioneerAVR command, handle exceptions and optionally repeating."""
         options = self.entry_options
         repeat_count = options[CONF_REPEAT_COUNT] if repeat else 1
+        retry_delay = options[CONF_RETRY_DELAY]
+        command_name = command or aw_f.__name__
 
         count = 0
         while count < repeat_count:
             try:
-                resp = await aw_f()
-                return resp
+                return await aw_f(*args, **kwargs)
             except AVRCommandError as exc:
-                await asyncio.sleep(1)
                 count += 1
                 if count >= repeat_count:
-                    raise ServiceValidationError(
-                        translation_domain=DOMAIN,
-                        translation_key="command_error",
-                        translation_placeholders={
-                            "command": command or aw_f.__name__,
-                            "exc": str(exc),
-                        },
-                    ) from exc
+                    raise self._command_exception(exc, command_name) from exc
                 _LOGGER.warning(
-                    "repeating failed command (%d): %s", count, aw_f.__name__
+                    "repeating failed command (%d): %s", count, command_name
+                )
+                await asyncio.sleep(
+                    min(retry_delay * 2 ** (count - 1), MAX_RETRY_DELAY)
                 )
             except Exception as exc:
-                raise ServiceValidationError(
-                    translation_domain=DOMAIN,
-                    translation_key=getattr(
-                        exc, "translation_key", "unknown_exception"
-                    ),
-                    translation_placeholders={
-                        "command": command or aw_f.__name__,
-                        "zone": self.zone,
-                        "exc": str(exc),
-                    },
-                ) from exc
+                raise self._command_exception(exc, command_name) from exc
+
+    async def pioneer_command_nowait(self, aw_f, *args, **kwargs):
+        """Execute a PioneerAVR command once without repeating, handle exceptions."""
+        try:
+            return await aw_f(*args, **kwargs)
+        except Exception as exc:
+            raise self._command_exception(exc, aw_f.__name__) from exc
 
 
 class PioneerTunerEntity(PioneerEntityBase):
@@ -108,10 +131,8 @@ class PioneerTunerEntity(PioneerEntityBase):
         """Returns whether the AVR is available and source is set to tuner."""
         if not super().available:
             return False
-        return bool(
-            [
-                z
-                for z, s in self.pioneer.source.items()
-                if s == SOURCE_TUNER and self.pioneer.power.get(Zones(z))
-            ]
+        pioneer = self.pioneer
+        power = pioneer.power
+        return any(
+            s == SOURCE_TUNER and power.get(z) for z, s in pioneer.source.items()
         )
@@ -3,8 +3,7 @@
 from __future__ import annotations
 
 import logging
-import json
-from typing import Any
+from typing import Any, NamedTuple
 
 import voluptuous as vol
 
@@ -26,10 +25,12 @@ from homeassistant.core import (
     ServiceCall,
     ServiceResponse,
     SupportsResponse,
+    callback,
 )
 from homeassistant.exceptions import PlatformNotReady
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
@@ -78,59 +79,81 @@ PARALLEL_UPDATES = 0
 
 PARAM_SCHEMA = vol.Schema({}, extra=vol.ALLOW_EXTRA)
 
-PIONEER_SEND_COMMAND_SCHEMA = {
-    vol.Required(ATTR_COMMAND): cv.string,
-    vol.Optional(ATTR_PREFIX): cv.string,
-    vol.Optional(ATTR_SUFFIX): cv.string,
-}
+PIONEER_SEND_COMMAND_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_COMMAND): cv.string,
+        vol.Optional(ATTR_PREFIX): cv.string,
+        vol.Optional(ATTR_SUFFIX): cv.string,
+    }
+)
 
-PIONEER_SET_PANEL_LOCK_SCHEMA = {
-    vol.Required(ATTR_PANEL_LOCK): cv.string,
-}
+PIONEER_SET_PANEL_LOCK_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_PANEL_LOCK): cv.string,
+    }
+)
 
-PIONEER_SET_REMOTE_LOCK_SCHEMA = {
-    vol.Required(ATTR_REMOTE_LOCK): cv.boolean,
-}
+PIONEER_SET_REMOTE_LOCK_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_REMOTE_LOCK): cv.boolean,
+    }
+)
 
-PIONEER_SERVICE_SET_DIMMER_SCHEMA = {
-    vol.Required(ATTR_DIMMER): cv.string,
-}
+PIONEER_SERVICE_SET_DIMMER_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_DIMMER): cv.string,
+    }
+)
 
-PIONEER_SET_TONE_SETTINGS_SCHEMA = {
-    vol.Required(ATTR_TONE): cv.string,
-    vol.Required(ATTR_TREBLE): vol.All(vol.Coerce(int), vol.Range(min=-6, max=6)),
-    vol.Required(ATTR_BASS): vol.All(vol.Coerce(int), vol.Range(min=-6, max=6)),
-}
+PIONEER_SET_TONE_SETTINGS_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_TONE): cv.string,
+        vol.Required(ATTR_TREBLE): vol.All(vol.Coerce(int), vol.Range(min=-6, max=6)),
+        vol.Required(ATTR_BASS): vol.All(vol.Coerce(int), vol.Range(min=-6, max=6)),
+    }
+)
 
 # PIONEER_SET_AMP_SETTINGS_SCHEMA = {
 # }
 
-PIONEER_SELECT_TUNER_BAND_SCHEMA = {
-    vol.Required(ATTR_BAND): str,
-}
+PIONEER_SELECT_TUNER_BAND_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_BAND): vol.Coerce(TunerBand),
+    }
+)
 
 
-PIONEER_SET_FM_TUNER_FREQUENCY_SCHEMA = {
-    vol.Required(ATTR_FREQUENCY): vol.All(
-        vol.Coerce(float), vol.Range(min=87.5, max=108)
-    ),
-}
+PIONEER_SET_FM_TUNER_FREQUENCY_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_FREQUENCY): vol.All(
+            vol.Coerce(float), vol.Range(min=87.5, max=108)
+        ),
+    }
+)
 
-PIONEER_SET_AM_TUNER_FREQUENCY_SCHEMA = {
-    vol.Required(ATTR_FREQUENCY): vol.All(
-        vol.Coerce(int), vol.Range(min=530, max=1700)
-    ),
-}
+PIONEER_SET_AM_TUNER_FREQUENCY_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_FREQUENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=530, max=1700)
+        ),
+    }
+)
 
-PIONEER_SELECT_TUNER_PRESET_SCHEMA = {
-    vol.Required(ATTR_CLASS): cv.string,
-    vol.Required(ATTR_PRESET): vol.All(vol.Coerce(int), vol.Range(min=1, max=9)),
-}
+PIONEER_SELECT_TUNER_PRESET_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_CLASS): cv.string,
+        vol.Required(ATTR_PRESET): vol.All(vol.Coerce(int), vol.Range(min=1, max=9)),
+    }
+)
 
-PIONEER_SET_CHANNEL_LEVELS_SCHEMA = {
-    vol.Required(ATTR_CHANNEL): cv.string,
-    vol.Required(ATTR_LEVEL): vol.All(vol.Coerce(float), vol.Range(min=-12, max=12)),
-}
+PIONEER_SET_CHANNEL_LEVELS_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_CHANNEL): cv.string,
+        vol.Required(ATTR_LEVEL): vol.All(
+            vol.Coerce(float), vol.Range(min=-12, max=12)
+        ),
+    }
+)
 
 # PIONEER_SET_VIDEO_SETTINGS_SCHEMA = {
 # }
@@ -139,6 +162,17 @@ PIONEER_SET_CHANNEL_LEVELS_SCHEMA = {
 # }
 
 
+class ZoneSnapshot(NamedTuple):
+    """Pioneer AVR zone state captured on coordinator update."""
+
+    power: bool | None
+    volume: int | None
+    max_volume: int | None
+    mute: bool | None
+    source: str | None
+    listening_mode: str | None
+
+
 ## Debug levels:
 ##  1: service calls
 ##  7: callback calls
@@ -171,6 +205,16 @@ async def async_setup_entry(
         _LOGGER.error("Main zone not found on AVR")
         raise PlatformNotReady  # pylint: disable=raise-missing-from
 
+    try:
+        await pioneer.update()
+    except Exception as exc:  # pylint: disable=broad-except
+        _LOGGER.error(
+            "Could not perform AVR initial update: %s: %s",
+            type(exc).__name__,
+            str(exc),
+        )
+        raise PlatformNotReady  # pylint: disable=raise-missing-from
+
     ## Add zone specific media_players
     entities = []
     _LOGGER.info("Adding entities for zones %s", pioneer.zones)
@@ -186,16 +230,6 @@ async def async_setup_entry(
         )
         _LOGGER.debug("Created entity for zone %s", zone)
 
-    try:
-        await pioneer.update()
-    except Exception as exc:  # pylint: disable=broad-except
-        _LOGGER.error(
-            "Could not perform AVR initial update: %s: %s",
-            type(exc).__name__,
-            str(exc),
-        )
-        raise PlatformNotReady  # pylint: disable=raise-missing-from
-
     async_add_entities(entities)
 
     ## Register platform specific services
@@ -279,11 +313,76 @@ class PioneerZone(
             _LOGGER.debug("PioneerZone.__init__(%s)", zone)
         super().__init__(pioneer, options, device_info=device_info, zone=zone)
         CoordinatorEntity.__init__(self, coordinator)
+        self._is_z1 = zone == Zones.Z1
+        self._zone_snapshot = self._get_zone_snapshot()
+        self._attr_supported_features: MediaPlayerEntityFeature | None = None
+        self._disable_auto_query = bool(pioneer.get_param(PARAM_DISABLE_AUTO_QUERY))
+        self._cached_sound_modes: list[str] | None = None
+        self._cached_source_list: list[str] | None = None
+        self._cached_sources_json: str | None = None
+        self._cached_modes_key: bool | None = None
+        self._cached_sources_key: tuple | None = None
+        self._state_signature: tuple | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh zone state when entity is added to hass."""
+        await super().async_added_to_hass()
+        self._zone_snapshot = self._get_zone_snapshot()
+        self._recompute_supported_features()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._zone_snapshot = self._get_zone_snapshot()
+        self._recompute_supported_features()
+
+        ## Listening modes depend on the input channels, and source lists on the
+        ## source name mappings: only rebuild cached lists if either has changed.
+        ## Sources may be renamed in place, so compare mapping contents
+        pioneer = self.pioneer
+        modes_key = pioneer.audio.get("input_multichannel")
+        if modes_key != self._cached_modes_key:
+            self._cached_modes_key = modes_key
+            self._cached_sound_modes = None
+        sources_key = tuple(pioneer.get_source_dict(self.zone).items())
+        if sources_key != self._cached_sources_key:
+            self._cached_sources_key = sources_key
+            self._cached_source_list = None
+            self._cached_sources_json = None
+
+        ## AVR signals all zones on each full poll: skip state writes for this
+        ## zone if nothing that it reports has changed. Include the resolved
+        ## source name, as a source may be renamed without its ID changing
+        state_signature = (
+            pioneer.available,
+            self._zone_snapshot,
+            self.source,
+            modes_key,
+            sources_key,
+            self._attr_supported_features,
+        )
+        if state_signature == self._state_signature:
+            return
+        self._state_signature = state_signature
+        super()._handle_coordinator_update()
+
+    def _get_zone_snapshot(self) -> ZoneSnapshot:
+        """Capture current zone state from the AVR."""
+        pioneer = self.pioneer
+        zone = self.zone
+        return ZoneSnapshot(
+            power=pioneer.power.get(zone),
+            volume=pioneer.volume.get(zone),
+            max_volume=pioneer.max_volume.get(zone),
+            mute=pioneer.mute.get(zone),
+            source=pioneer.source.get(zone),
+            listening_mode=pioneer.listening_mode,
+        )
 
     @property
     def state(self) -> MediaPlayerState:
         """Return the state of the zone."""
-        state = self.pioneer.power.get(self.zone)
+        state = self._zone_snapshot.power
         if state is None:
             return STATE_UNKNOWN
         return MediaPlayerState.ON if state else MediaPlayerState.OFF
@@ -296,68 +395,76 @@ class PioneerZone(
     @property
     def volume_level(self) -> float:
         """Volume level of the media player (0..1)."""
-        volume = self.pioneer.volume.get(self.zone)
-        max_volume = self.pioneer.max_volume.get(self.zone)
+        snapshot = self._zone_snapshot
+        volume = snapshot.volume
+        max_volume = snapshot.max_volume
         return volume / max_volume if (volume and max_volume) else float(0)
 
     @property
     def is_volume_muted(self) -> bool:
         """Boolean if volume is currently muted."""
-        return self.pioneer.mute.get(self.zone, False)
+        mute = self._zone_snapshot.mute
+        return False if mute is None else mute
 
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:
         """Flag media player features that are supported."""
+        if self._attr_supported_features is None:
+            self._recompute_supported_features()
+        return self._attr_supported_features
+
+    def _recompute_supported_features(self) -> None:
+        """Update supported media player features from current AVR state."""
         ## Automatically detect what features are supported by what parameters are available
         features = MediaPlayerEntityFeature(0)
-        pioneer = self.pioneer
-        if pioneer.power.get(self.zone) is not None:
+        snapshot = self._zone_snapshot
+        if snapshot.power is not None:
             features |= MediaPlayerEntityFeature.TURN_ON
             features |= MediaPlayerEntityFeature.TURN_OFF
-        if pioneer.volume.get(self.zone) is not None:
+        if snapshot.volume is not None:
             features |= MediaPlayerEntityFeature.VOLUME_SET
             features |= MediaPlayerEntityFeature.VOLUME_STEP
-        if pioneer.mute.get(self.zone) is not None:
+        if snapshot.mute is not None:
             features |= MediaPlayerEntityFeature.VOLUME_MUTE
-        if pioneer.source.get(self.zone) is not None:
+        if snapshot.source is not None:
             features |= MediaPlayerEntityFeature.SELECT_SOURCE
 
         ## Sound mode is only available on main zone, also it does not return an
         ## output if the AVR is off so add this manually until we figure out a better way
         ## Disable sound mode also if autoquery is disabled
-        if self.zone == Zones.Z1 and not pioneer.get_params().get(
-            PARAM_DISABLE_AUTO_QUERY
-        ):
+        if self._is_z1 and not self._disable_auto_query:
             features |= MediaPlayerEntityFeature.SELECT_SOUND_MODE
 
         ## Enable prev/next track if tuner enabled
-        if pioneer.source.get(self.zone) == SOURCE_TUNER:
+        if snapshot.source == SOURCE_TUNER:
             features |= MediaPlayerEntityFeature.PREVIOUS_TRACK
             features |= MediaPlayerEntityFeature.NEXT_TRACK
 
-        return features
+        self._attr_supported_features = features
 
     @property
     def sound_mode(self) -> str | None:
         """Return the current sound mode."""
         ## Sound modes only supported on zones with speakers, return null if nothing found
-        return self.pioneer.listening_mode
+        return self._zone_snapshot.listening_mode
 
     @property
     def sound_mode_list(self) -> list[str]:
         """Returns all valid sound modes from aiopioneer."""
-        if self.zone != Zones.Z1:
+        if not self._is_z1:
             return None
 
-        listening_modes = self.pioneer.get_listening_modes()
-        return (
-            [v for _, v in sorted(listening_modes.items())] if listening_modes else None
-        )
+        if self._cached_sound_modes is None:
+            listening_modes = self.pioneer.get_listening_modes()
+            self._cached_sound_modes = [
+                listening_modes[k] for k in sorted(listening_modes or {})
+            ]
+        return self._cached_sound_modes or None
 
     @property
     def source(self) -> str | None:
         """Return the current input source."""
-        source_id = self.pioneer.source.get(self.zone)
+        source_id = self._zone_snapshot.source
         if source_id:
             return self.pioneer.get_source_name(source_id)
         else:
@@ -366,7 +473,9 @@ class PioneerZone(
     @property
     def source_list(self) -> list[str]:
         """List of available input sources."""
-        return self.pioneer.get_source_list(self.zone)
+        if self._cached_source_list is None:
+            self._cached_source_list = self.pioneer.get_source_list(self.zone)
+        return self._cached_source_list
 
     @property
     def media_title(self) -> str:
@@ -376,14 +485,18 @@ class PioneerZone(
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return device specific state attributes."""
-        pioneer = self.pioneer
-        attrs = {"sources_json": json.dumps(pioneer.get_source_dict(self.zone))}
+        if self._cached_sources_json is None:
+            self._cached_sources_json = json_dumps(
+                self.pioneer.get_source_dict(self.zone)
+            )
+        attrs = {"sources_json": self._cached_sources_json}
 
         ## Return max volume attributes
-        volume = pioneer.volume.get(self.zone)
-        max_volume = pioneer.max_volume.get(self.zone)
+        snapshot = self._zone_snapshot
+        volume = snapshot.volume
+        max_volume = snapshot.max_volume
         if volume is not None and max_volume is not None:
-            if self.zone == Zones.Z1:
+            if self._is_z1:
                 volume_db = volume / 2 - 80.5
             else:
                 volume_db = volume - 81
@@ -394,101 +507,64 @@ class PioneerZone(
             }
         return attrs
 
-    async def async_update(self) -> None:
-        """Poll properties on demand."""
-        if _debug_atlevel(8):
-            _LOGGER.debug(">> PioneerZone.async_update(%s)", self.zone)
-        return await self.pioneer.update()
-
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
-
-        async def turn_on() -> None:
-            await self.pioneer.turn_on(zone=self.zone)
-
-        await self.pioneer_command(turn_on, repeat=True)
+        await self.pioneer_command(self.pioneer.turn_on, zone=self.zone, repeat=True)
 
     async def async_turn_off(self) -> None:
         """Turn off media player."""
-
-        async def turn_off() -> None:
-            await self.pioneer.turn_off(zone=self.zone)
-
-        await self.pioneer_command(turn_off, repeat=True)
+        await self.pioneer_command(self.pioneer.turn_off, zone=self.zone, repeat=True)
 
     async def async_select_source(self, source: str) -> None:
         """Select input source."""
-
-        async def select_source() -> None:
-            await self.pioneer.select_source(source, zone=self.zone)
-
-        await self.pioneer_command(select_source, repeat=True)
+        await self.pioneer_command(
+            self.pioneer.select_source, source, zone=self.zone, repeat=True
+        )
 
     async def async_volume_up(self) -> None:
         """Volume up media player."""
-
-        async def volume_up() -> None:
-            await self.pioneer.volume_up(zone=self.zone)
-
-        await self.pioneer_command(volume_up)
+        await self.pioneer_command_nowait(self.pioneer.volume_up, zone=self.zone)
 
     async def async_volume_down(self) -> None:
         """Volume down media player."""
-
-        async def volume_down() -> None:
-            await self.pioneer.volume_down(zone=self.zone)
-
-        await self.pioneer_command(volume_down)
+        await self.pioneer_command_nowait(self.pioneer.volume_down, zone=self.zone)
 
     async def async_media_previous_track(self) -> None:
         """Send previous track command."""
-
-        async def tuner_previous_preset() -> None:
-            await self.pioneer.tuner_previous_preset()
-
-        await self.pioneer_command(tuner_previous_preset)
+        await self.pioneer_command_nowait(self.pioneer.tuner_previous_preset)
 
     async def async_media_next_track(self) -> None:
         """Send next track command."""
-
-        async def tuner_next_preset() -> None:
-            return await self.pioneer.tuner_next_preset()
-
-        await self.pioneer_command(tuner_next_preset)
+        await self.pioneer_command_nowait(self.pioneer.tuner_next_preset)
 
     async def async_set_volume_level(self, volume) -> None:
         """Set volume level, range 0..1."""
         max_volume = self.pioneer.max_volume.get(self.zone)
-
-        async def set_volume_level() -> None:
-            await self.pioneer.set_volume_level(
-                round(volume * max_volume), zone=self.zone
-            )
-
-        if self.pioneer.get_params().get(PARAM_VOLUME_STEP_ONLY):
-            await self.pioneer_command(set_volume_level)
-        else:
-            await self.pioneer_command(set_volume_level, repeat=True)
+        try:
+            target_volume = round(volume * max_volume)
+        except TypeError as exc:  ## max_volume not yet queried from AVR
+            raise self._command_exception(exc, "set_volume_level") from exc
+        await self.pioneer_command(
+            self.pioneer.set_volume_level,
+            target_volume,
+            zone=self.zone,
+            repeat=not self.pioneer.get_param(PARAM_VOLUME_STEP_ONLY),
+        )
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute (true) or unmute (false) media player."""
-
-        async def mute_volume() -> None:
-            if mute:
-                await self.pioneer.mute_on(zone=self.zone)
-            else:
-                await self.pioneer.mute_off(zone=self.zone)
-
-        await self.pioneer_command(mute_volume, repeat=True)
+        await self.pioneer_command(
+            self.pioneer.mute_on if mute else self.pioneer.mute_off,
+            zone=self.zone,
+            repeat=True,
+        )
 
     async def async_select_sound_mode(self, sound_mode) -> None:
         """Select the sound mode."""
-
-        async def select_sound_mode() -> None:
-            ## aiopioneer will translate sound modes
-            await self.pioneer.select_listening_mode(sound_mode)
-
-        await self.pioneer_command(select_sound_mode, repeat=True)
+        ## aiopioneer will translate sound modes
+        await self.pioneer_command(
+            self.pioneer.select_listening_mode, sound_mode, repeat=True
+        )
 
     async def async_send_command(self, service_call: ServiceCall) -> ServiceResponse:
         """Send command to the AVR."""
@@ -503,12 +579,14 @@ class PioneerZone(
             suffix,
         )
 
-        async def send_command():
-            return await self.pioneer.send_command(
-                command, zone=self.zone, prefix=prefix, suffix=suffix
-            )
-
-        resp = await self.pioneer_command(send_command, command=command)
+        resp = await self.pioneer_command(
+            self.pioneer.send_command,
+            command,
+            zone=self.zone,
+            prefix=prefix,
+            suffix=suffix,
+            command=command,
+        )
         if service_call.return_response:
             return resp
 
@@ -516,31 +594,19 @@ class PioneerZone(
         """Set AVR panel lock."""
         if _debug_atlevel(1):
             _LOGGER.debug(">> PioneerZone.set_panel_lock(panel_lock=%s)", panel_lock)
-
-        async def set_panel_lock() -> None:
-            await self.pioneer.set_panel_lock(panel_lock)
-
-        await self.pioneer_command(set_panel_lock)
+        await self.pioneer_command(self.pioneer.set_panel_lock, panel_lock)
 
     async def async_set_remote_lock(self, remote_lock: bool) -> None:
         """Set AVR remote lock."""
         if _debug_atlevel(1):
             _LOGGER.debug(">> PioneerZone.set_remote_lock(remote_lock=%s)", remote_lock)
-
-        async def set_remote_lock() -> None:
-            await self.pioneer.set_remote_lock(remote_lock)
-
-        await self.pioneer_command(set_remote_lock)
+        await self.pioneer_command(self.pioneer.set_remote_lock, remote_lock)
 
     async def async_set_dimmer(self, dimmer: str) -> None:
         """Set AVR display dimmer."""
         if _debug_atlevel(1):
             _LOGGER.debug(">> PioneerZone.set_dimmer(dimmer=%s)", dimmer)
-
-        async def set_dimmer() -> None:
-            await self.pioneer.set_dimmer(dimmer)
-
-        await self.pioneer_command(set_dimmer)
+        await self.pioneer_command(self.pioneer.set_dimmer, dimmer)
 
     async def async_set_tone_settings(self, tone: str, treble: int, bass: int) -> None:
         """Set AVR tone settings for zone."""
@@ -552,24 +618,23 @@ class PioneerZone(
                 treble,
                 bass,
             )
+        await self.pioneer_command(
+            self.pioneer.set_tone_settings,
+            tone,
+            treble,
+            bass,
+            zone=self.zone,
+            repeat=True,
+        )
 
-        async def set_tone_settings() -> None:
-            await self.pioneer.set_tone_settings(tone, treble, bass, zone=self.zone)
-
-        await self.pioneer_command(set_tone_settings, repeat=True)
-
-    async def async_select_tuner_band(self, band: str) -> None:
+    async def async_select_tuner_band(self, band: TunerBand) -> None:
         """Set AVR tuner band."""
         if _debug_atlevel(1):
             _LOGGER.debug(
                 ">> PioneerZone.select_tuner_band(band=%s)",
                 band,
             )
-
-        async def select_tuner_band() -> None:
-            await self.pioneer.select_tuner_band(TunerBand(band))
-
-        await self.pioneer_command(select_tuner_band, repeat=True)
+        await self.pioneer_command(self.pioneer.select_tuner_band, band, repeat=True)
 
     async def async_set_fm_tuner_frequency(self, frequency: float) -> None:
         """Set AVR AM tuner frequency."""
@@ -578,11 +643,9 @@ class PioneerZone(
                 ">> PioneerZone.set_fm_tuner_frequency(frequency=%f)",
                 frequency,
             )
-
-        async def set_fm_tuner_frequency() -> None:
-            await self.pioneer.set_tuner_frequency(TunerBand.FM, frequency)
-
-        await self.pioneer_command(set_fm_tuner_frequency, repeat=True)
+        await self.pioneer_command(
+            self.pioneer.set_tuner_frequency, TunerBand.FM, frequency, repeat=True
+        )
 
     async def async_set_am_tuner_frequency(self, frequency: int) -> None:
         """Set AVR AM tuner frequency."""
@@ -591,11 +654,12 @@ class PioneerZone(
                 ">> PioneerZone.set_am_tuner_frequency(frequency=%d)",
                 frequency,
             )
-
-        async def set_am_tuner_frequency() -> None:
-            await self.pioneer.set_tuner_frequency(TunerBand.AM, float(frequency))
-
-        await self.pioneer_command(set_am_tuner_frequency, repeat=True)
+        await self.pioneer_command(
+            self.pioneer.set_tuner_frequency,
+            TunerBand.AM,
+            float(frequency),
+            repeat=True,
+        )
 
     async def async_select_tuner_preset(self, **kwargs) -> None:
         """Set AVR tuner preset."""
@@ -607,11 +671,9 @@ class PioneerZone(
                 tuner_class,
                 preset,
             )
-
-        async def select_tuner_preset() -> None:
-            await self.pioneer.select_tuner_preset(tuner_class, preset)
-
-        await self.pioneer_command(select_tuner_preset, repeat=True)
+        await self.pioneer_command(
+            self.pioneer.select_tuner_preset, tuner_class, preset, repeat=True
+        )
 
     async def async_set_channel_levels(self, channel: str, level: float) -> None:
         """Set AVR level (gain) for amplifier channel in zone."""
@@ -622,8 +684,6 @@ class PioneerZone(
                 channel,
                 level,
             )
-
-        async def set_channel_levels() -> None:
-            await self.pioneer.set_channel_levels(channel, level, zone=self.zone)
-
-        await self.pioneer_command(set_channel_levels, repeat=True)
+        await self.pioneer_command(
+            self.pioneer.set_channel_levels, channel, level, zone=self.zone, repeat=True
+        )
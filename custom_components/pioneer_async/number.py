@@ -155,8 +155,6 @@ class TunerFrequencyNumber(
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the tuner frequency."""
-
-        async def set_tuner_frequency() -> bool:
-            return await self.pioneer.set_tuner_frequency(self.band, value)
-
-        await self.pioneer_command(set_tuner_frequency, repeat=True)
+        await self.pioneer_command(
+            self.pioneer.set_tuner_frequency, self.band, value, repeat=True
+        )
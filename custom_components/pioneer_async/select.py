@@ -126,11 +126,9 @@ class TunerPresetSelect(
         """Change the selected option."""
         tuner_class = option[0]
         tuner_preset = int(option[1])
-
-        async def select_tuner_preset() -> bool:
-            return await self.pioneer.select_tuner_preset(tuner_class, tuner_preset)
-
-        await self.pioneer_command(select_tuner_preset, repeat=True)
+        await self.pioneer_command(
+            self.pioneer.select_tuner_preset, tuner_class, tuner_preset, repeat=True
+        )
 
 
 class TunerBandSelect(
@@ -163,8 +161,6 @@ class TunerBandSelect(
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-
-        async def select_tuner_band() -> bool:
-            return await self.pioneer.select_tuner_band(TunerBand(option))
-
-        await self.pioneer_command(select_tuner_band, repeat=True)
+        await self.pioneer_command(
+            self.pioneer.select_tuner_band, TunerBand(option), repeat=True
+        )